@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+DNS engine benchmark
+Runs dns_engine against a local stub DNS server and reports queries per second.
+"""
+import time
+import random
+import struct
+import socket
+import asyncio
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+import dns_engine
+
+###############################################################################
+# Stub DNS server
+###############################################################################
+
+class StubDNSServer(asyncio.DatagramProtocol):
+    """Authoritative-looking UDP server answering A queries from a dict.
+
+    Names under any zone in ``wildcard_zones`` resolve to that zone's
+    wildcard address, everything else unknown gets NXDOMAIN.
+    """
+
+    def __init__(self, records: Dict[str, str], wildcard_zones: Optional[Dict[str, str]] = None):
+        self.records = records
+        self.wildcard_zones = wildcard_zones or {}
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.answered = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+    def _lookup(self, name: str) -> Optional[str]:
+        if name in self.records:
+            return self.records[name]
+        for zone, address in self.wildcard_zones.items():
+            if name.endswith("." + zone):
+                return address
+        return None
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        txid, _, qdcount = struct.unpack_from("!HHH", data)
+        name, end = dns_engine._read_name(data, 12)
+        question = data[12:end + 4]
+        address = self._lookup(name)
+        if address is None:
+            header = struct.pack("!HHHHHH", txid, 0x8183, qdcount, 0, 0, 0)
+            answer = b""
+        else:
+            header = struct.pack("!HHHHHH", txid, 0x8180, qdcount, 1, 0, 0)
+            answer = struct.pack("!HHHIH", 0xC00C, dns_engine.QTYPE_A, 1, 60, 4) + socket.inet_aton(address)
+        self.answered += 1
+        self.transport.sendto(header + question + answer, addr)
+
+async def start_stub_servers(count: int, records: Dict[str, str],
+                             wildcard_zones: Optional[Dict[str, str]] = None) -> List[Tuple[asyncio.DatagramTransport, StubDNSServer]]:
+    """Start count stub servers on 127.0.0.1 random ports."""
+    loop = asyncio.get_running_loop()
+    servers = []
+    for _ in range(count):
+        transport, protocol = await loop.create_datagram_endpoint(
+            lambda: StubDNSServer(records, wildcard_zones), local_addr=("127.0.0.1", 0))
+        transport.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, dns_engine.SOCKET_BUFFER)
+        servers.append((transport, protocol))
+    return servers
+
+###############################################################################
+# Benchmark
+###############################################################################
+
+async def run_benchmark(words: int, hits: int, servers: int, concurrency: int, rate: float) -> Dict[str, float]:
+    domain = "bench.test"
+    wordlist = [f"host{i}" for i in range(words)]
+    records = {f"{w}.{domain}": f"10.0.{i // 256 % 256}.{i % 256}" for i, w in enumerate(random.sample(wordlist, hits))}
+    # A wildcard sub-zone whose hosts must be filtered out
+    records["wild." + domain] = "10.255.0.1"
+    stubs = await start_stub_servers(servers, records, {"wild." + domain: "10.255.255.255"})
+    resolvers = [dns_engine.Resolver("127.0.0.1", t.get_extra_info("sockname")[1], rate) for t, _ in stubs]
+
+    candidates = list(dns_engine.wordlist_candidates(wordlist, domain))
+    candidates += ["wild." + domain] + [f"x{i}.wild.{domain}" for i in range(min(1000, words))]
+
+    try:
+        async with dns_engine.DNSEngine(resolvers, concurrency=concurrency, timeout=1.0) as engine:
+            started = time.perf_counter()
+            found = await dns_engine.resolve_all(engine, candidates)
+            elapsed = time.perf_counter() - started
+    finally:
+        for transport, _ in stubs:
+            transport.close()
+
+    assert len(found) == hits + 1, f"expected {hits + 1} hosts, got {len(found)}"
+    return {
+        "candidates": len(candidates),
+        "queries": engine.stats["queries"],
+        "resolved": len(found),
+        "wildcard_filtered": engine.stats["wildcard_filtered"],
+        "timeouts": engine.stats["timeouts"],
+        "seconds": elapsed,
+        "qps": engine.stats["queries"] / elapsed,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dns_engine against local stub DNS servers")
+    parser.add_argument("--words", type=int, default=50_000)
+    parser.add_argument("--hits", type=int, default=500)
+    parser.add_argument("--servers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=0.0, help="Per-resolver qps limit (0 = unlimited)")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run_benchmark(args.words, args.hits, args.servers, args.concurrency, args.rate))
+    print(f"candidates={result['candidates']} queries={result['queries']} resolved={result['resolved']} "
+          f"wildcard_filtered={result['wildcard_filtered']} timeouts={result['timeouts']} time={result['seconds']:.2f}s qps={result['qps']:.0f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Dashboard startup benchmark
+Measures cold create_app() time and gunicorn worker boot time / RSS, with and
+without preload_app.
+"""
+import os
+import sys
+import time
+import socket
+import signal
+import tempfile
+import statistics
+import subprocess
+import urllib.request
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BASE_DIR = Path(__file__).resolve().parent
+
+COLD_BOOT_SNIPPET = (
+    "import time; t = time.perf_counter(); "
+    "import dashboard_app_enhanced as d; d.create_app(); "
+    "print(time.perf_counter() - t)"
+)
+
+###############################################################################
+# Helpers
+###############################################################################
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def _children(pid: int) -> List[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as fh:
+            return [int(p) for p in fh.read().split()]
+    except OSError:
+        return []
+
+def memory_kb(pid: int) -> Dict[str, int]:
+    """Rss/Pss/private memory of a process from /proc (Linux only)."""
+    fields: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as fh:
+            for line in fh:
+                key, _, value = line.partition(":")
+                if value.strip().endswith("kB"):
+                    fields[key] = int(value.split()[0])
+    except OSError:
+        return {}
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+###############################################################################
+# Benchmarks
+###############################################################################
+
+def bench_cold_boot(runs: int, env: Dict[str, str]) -> List[float]:
+    """Time import + create_app() in fresh interpreters."""
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", COLD_BOOT_SNIPPET], cwd=BASE_DIR, env=env,
+                             capture_output=True, text=True, check=True)
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return timings
+
+def bench_gunicorn(workers: int, preload: bool, requests: int, env: Dict[str, str],
+                   timeout: float = 30.0) -> Dict[str, object]:
+    """Start gunicorn, wait for the first response, then sample worker memory."""
+    port = _free_port()
+    env = dict(env, BUGHUNTER_BIND=f"127.0.0.1:{port}", BUGHUNTER_WORKERS=str(workers),
+               BUGHUNTER_PRELOAD="1" if preload else "0")
+    started = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"], cwd=BASE_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}/"
+    try:
+        first_response = None
+        while time.perf_counter() - started < timeout:
+            try:
+                urllib.request.urlopen(url, timeout=1).read()
+                first_response = time.perf_counter() - started
+                break
+            except OSError:
+                time.sleep(0.02)
+        if first_response is None:
+            raise RuntimeError("gunicorn did not answer within the timeout")
+        while len(_children(proc.pid)) < workers and time.perf_counter() - started < timeout:
+            time.sleep(0.05)
+        for _ in range(requests):
+            urllib.request.urlopen(url, timeout=5).read()
+        worker_memory = [memory_kb(pid) for pid in _children(proc.pid)]
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=timeout)
+    return {"first_response": first_response, "workers": worker_memory}
+
+###############################################################################
+# Main
+###############################################################################
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dashboard cold boot and gunicorn worker memory")
+    parser.add_argument("--runs", type=int, default=5, help="Cold-boot samples")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=50, help="Warm-up requests before sampling memory")
+    parser.add_argument("--skip-gunicorn", action="store_true")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, BUGHUNTER_DB=str(Path(tmp) / "bench.db"))
+
+        timings = bench_cold_boot(args.runs, env)
+        print(f"cold boot (import + create_app): min={min(timings) * 1000:.1f}ms "
+              f"median={statistics.median(timings) * 1000:.1f}ms over {len(timings)} runs")
+
+        if args.skip_gunicorn:
+            return 0
+        for preload in (False, True):
+            result = bench_gunicorn(args.workers, preload, args.requests, env)
+            workers = result["workers"]
+            avg = lambda key: sum(w.get(key, 0) for w in workers) / max(len(workers), 1) / 1024
+            print(f"gunicorn preload={'on ' if preload else 'off'} workers={len(workers)} "
+                  f"first_response={result['first_response'] * 1000:.0f}ms "
+                  f"rss={avg('rss'):.1f}MB pss={avg('pss'):.1f}MB private={avg('private'):.1f}MB per worker")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
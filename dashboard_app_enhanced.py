@@ -8,30 +8,54 @@ import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 
-from flask import Flask, render_template, request, jsonify, abort, redirect, url_for
-
-# Optional feedparser (fallback for Python 3.13)
-try:
-    import feedparser
-    FEED_OK = True
-except Exception:
-    FEED_OK = False
+from flask import Flask, render_template, request, jsonify, abort, redirect, url_for, Response
 
 ###############################################################################
 # Configuration
 ###############################################################################
 BASE_DIR = Path(__file__).resolve().parent
-DB_PATH = BASE_DIR / "bug_hunter_enhanced.db"
+DB_PATH = Path(os.environ.get("BUGHUNTER_DB", BASE_DIR / "bug_hunter_enhanced.db"))
 UPLOAD_DIR = BASE_DIR / "uploads"
-UPLOAD_DIR.mkdir(exist_ok=True)
 
 ###############################################################################
-# Flask app
+# Lazy subsystems
+###############################################################################
+
+_feedparser = None
+
+def get_feedparser():
+    """Import feedparser on first use; None if unavailable (e.g. Python 3.13)."""
+    global _feedparser
+    if _feedparser is None:
+        try:
+            import feedparser
+            _feedparser = feedparser
+        except Exception:
+            _feedparser = False
+    return _feedparser or None
+
+###############################################################################
+# Route registry
 ###############################################################################
-app = Flask(__name__)
-app.secret_key = "change-this-secret-key-in-production"
+# Views are collected here at import time and bound to an app in create_app(),
+# so importing this module does not build a Flask app.
+
+_ROUTES: List[tuple] = []
+_ERROR_HANDLERS: List[tuple] = []
+
+def route(rule: str, **options: Any) -> Callable:
+    def decorator(view: Callable) -> Callable:
+        _ROUTES.append((rule, view, options))
+        return view
+    return decorator
+
+def errorhandler(code: int) -> Callable:
+    def decorator(handler: Callable) -> Callable:
+        _ERROR_HANDLERS.append((code, handler))
+        return handler
+    return decorator
 
 ###############################################################################
 # Database helpers
@@ -42,191 +66,207 @@ def db_connect() -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     return conn
 
+SCHEMA_MIGRATIONS: List[List[str]] = [
+    # 1: baseline schema
+    [
+        # Platforms table
+        """
+            CREATE TABLE IF NOT EXISTS platforms (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                url TEXT,
+                platform_type TEXT DEFAULT 'public',
+                api_key TEXT,
+                is_active INTEGER DEFAULT 1,
+                description TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Bug reports table
+        """
+            CREATE TABLE IF NOT EXISTS bug_reports (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                description TEXT,
+                severity TEXT,
+                status TEXT DEFAULT 'draft',
+                vulnerability_type TEXT,
+                target_url TEXT,
+                platform TEXT,
+                program_name TEXT,
+                bounty_amount REAL DEFAULT 0,
+                poc_steps TEXT,
+                impact_description TEXT,
+                remediation_suggestion TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Personal notes table
+        """
+            CREATE TABLE IF NOT EXISTS personal_notes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                content TEXT,
+                category TEXT DEFAULT 'general',
+                tags TEXT,
+                is_pinned INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Recon campaigns table
+        """
+            CREATE TABLE IF NOT EXISTS recon_campaigns (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                target_domain TEXT NOT NULL,
+                status TEXT DEFAULT 'pending',
+                subdomain_count INTEGER DEFAULT 0,
+                live_host_count INTEGER DEFAULT 0,
+                scope_size TEXT DEFAULT 'medium',
+                script_name TEXT,
+                log_path TEXT,
+                is_stopped INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Security checklists table
+        """
+            CREATE TABLE IF NOT EXISTS security_checklists (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                type TEXT DEFAULT 'web',
+                description TEXT,
+                items TEXT,
+                progress INTEGER DEFAULT 0,
+                source_url TEXT,
+                is_template INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Tips and tricks table
+        """
+            CREATE TABLE IF NOT EXISTS tips_tricks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT,
+                category TEXT DEFAULT 'general',
+                difficulty TEXT DEFAULT 'beginner',
+                tags TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Reading list table
+        """
+            CREATE TABLE IF NOT EXISTS reading_list (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                url TEXT,
+                description TEXT,
+                category TEXT DEFAULT 'article',
+                is_read INTEGER DEFAULT 0,
+                priority INTEGER DEFAULT 1,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Useful links table
+        """
+            CREATE TABLE IF NOT EXISTS useful_links (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                url TEXT NOT NULL,
+                description TEXT,
+                category TEXT DEFAULT 'tools',
+                tags TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # News articles table
+        """
+            CREATE TABLE IF NOT EXISTS news_articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                content TEXT,
+                url TEXT,
+                source TEXT,
+                category TEXT,
+                published_date DATETIME,
+                is_read INTEGER DEFAULT 0,
+                is_favorite INTEGER DEFAULT 0
+            )
+        """,
+        # Attack scripts table
+        """
+            CREATE TABLE IF NOT EXISTS attack_scripts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                filename TEXT,
+                language TEXT DEFAULT 'bash',
+                description TEXT,
+                file_path TEXT,
+                status TEXT DEFAULT 'ready',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Exploit scripts table
+        """
+            CREATE TABLE IF NOT EXISTS exploit_scripts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                filename TEXT,
+                language TEXT DEFAULT 'bash',
+                description TEXT,
+                file_path TEXT,
+                status TEXT DEFAULT 'ready',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+        # Bounty targets table
+        """
+            CREATE TABLE IF NOT EXISTS bounty_targets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                description TEXT,
+                target_amount REAL,
+                current_amount REAL DEFAULT 0,
+                deadline DATE,
+                is_active INTEGER DEFAULT 1,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """,
+    ],
+]
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Schema version stored in the database header (PRAGMA user_version)."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
 def init_db() -> None:
-    """Create all required tables if they do not exist."""
-    conn = db_connect()
-    c = conn.cursor()
-
-    # Platforms table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS platforms (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            url TEXT,
-            platform_type TEXT DEFAULT 'public',
-            api_key TEXT,
-            is_active INTEGER DEFAULT 1,
-            description TEXT,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Bug reports table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS bug_reports (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            description TEXT,
-            severity TEXT,
-            status TEXT DEFAULT 'draft',
-            vulnerability_type TEXT,
-            target_url TEXT,
-            platform TEXT,
-            program_name TEXT,
-            bounty_amount REAL DEFAULT 0,
-            poc_steps TEXT,
-            impact_description TEXT,
-            remediation_suggestion TEXT,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Personal notes table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS personal_notes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            content TEXT,
-            category TEXT DEFAULT 'general',
-            tags TEXT,
-            is_pinned INTEGER DEFAULT 0,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Recon campaigns table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS recon_campaigns (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            target_domain TEXT NOT NULL,
-            status TEXT DEFAULT 'pending',
-            subdomain_count INTEGER DEFAULT 0,
-            live_host_count INTEGER DEFAULT 0,
-            scope_size TEXT DEFAULT 'medium',
-            script_name TEXT,
-            log_path TEXT,
-            is_stopped INTEGER DEFAULT 0,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Security checklists table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS security_checklists (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            type TEXT DEFAULT 'web',
-            description TEXT,
-            items TEXT,
-            progress INTEGER DEFAULT 0,
-            source_url TEXT,
-            is_template INTEGER DEFAULT 0,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Tips and tricks table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS tips_tricks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            content TEXT,
-            category TEXT DEFAULT 'general',
-            difficulty TEXT DEFAULT 'beginner',
-            tags TEXT,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Reading list table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS reading_list (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            url TEXT,
-            description TEXT,
-            category TEXT DEFAULT 'article',
-            is_read INTEGER DEFAULT 0,
-            priority INTEGER DEFAULT 1,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Useful links table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS useful_links (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            url TEXT NOT NULL,
-            description TEXT,
-            category TEXT DEFAULT 'tools',
-            tags TEXT,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # News articles table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS news_articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            content TEXT,
-            url TEXT,
-            source TEXT,
-            category TEXT,
-            published_date DATETIME,
-            is_read INTEGER DEFAULT 0,
-            is_favorite INTEGER DEFAULT 0
-        )
-    """)
-
-    # Attack scripts table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS attack_scripts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            filename TEXT,
-            language TEXT DEFAULT 'bash',
-            description TEXT,
-            file_path TEXT,
-            status TEXT DEFAULT 'ready',
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Exploit scripts table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS exploit_scripts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            filename TEXT,
-            language TEXT DEFAULT 'bash',
-            description TEXT,
-            file_path TEXT,
-            status TEXT DEFAULT 'ready',
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Bounty targets table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS bounty_targets (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT,
-            description TEXT,
-            target_amount REAL,
-            current_amount REAL DEFAULT 0,
-            deadline DATE,
-            is_active INTEGER DEFAULT 1,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
+    """Apply pending schema migrations.
 
-    conn.commit()
-    conn.close()
+    The applied version lives in PRAGMA user_version, so an up-to-date
+    database costs one pragma read. BEGIN IMMEDIATE serialises workers that
+    boot concurrently against a fresh database.
+    """
+    conn = db_connect()
+    try:
+        if schema_version(conn) >= len(SCHEMA_MIGRATIONS):
+            return
+        conn.isolation_level = None
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = schema_version(conn)
+            for statements in SCHEMA_MIGRATIONS[version:]:
+                for statement in statements:
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {len(SCHEMA_MIGRATIONS)}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
 
 ###############################################################################
 # Utility functions
@@ -286,7 +326,8 @@ def get_dashboard_stats() -> Dict[str, Any]:
 
 def fetch_rss_news(limit: int = 30) -> List[Dict[str, Any]]:
     """Fetch news from RSS feeds with fallback."""
-    if FEED_OK:
+    feedparser = get_feedparser()
+    if feedparser:
         try:
             feed = feedparser.parse("https://hackerone.com/hacktivity.rss")
             articles = []
@@ -343,7 +384,7 @@ def fetch_rss_news(limit: int = 30) -> List[Dict[str, Any]]:
 # Main Routes
 ###############################################################################
 
-@app.route("/")
+@route("/")
 def dashboard():
     """Dashboard page with statistics."""
     try:
@@ -360,7 +401,7 @@ def dashboard():
     
     return render_template("dashboard.html", stats=stats)
 
-@app.route("/platforms")
+@route("/platforms")
 def platforms():
     """Bug bounty platforms page."""
     conn = db_connect()
@@ -368,7 +409,7 @@ def platforms():
     conn.close()
     return render_template("platforms.html", platforms=[dict(p) for p in platforms])
 
-@app.route("/bug_reports")
+@route("/bug_reports")
 def bug_reports():
     """Bug reports page."""
     conn = db_connect()
@@ -376,7 +417,7 @@ def bug_reports():
     conn.close()
     return render_template("bug_reports.html", bugs=[dict(b) for b in bugs])
 
-@app.route("/security_checklist")
+@route("/security_checklist")
 def security_checklist():
     """Security checklist page."""
     conn = db_connect()
@@ -384,7 +425,7 @@ def security_checklist():
     conn.close()
     return render_template("checklist.html", checklists=[dict(c) for c in checklists])
 
-@app.route("/tips_tricks")
+@route("/tips_tricks")
 def tips_tricks():
     """Tips and tricks page."""
     conn = db_connect()
@@ -392,7 +433,7 @@ def tips_tricks():
     conn.close()
     return render_template("tips.html", tips=[dict(t) for t in tips])
 
-@app.route("/reading_list")
+@route("/reading_list")
 def reading_list():
     """Reading list page."""
     conn = db_connect()
@@ -400,13 +441,13 @@ def reading_list():
     conn.close()
     return render_template("reading.html", reading=[dict(r) for r in reading])
 
-@app.route("/news_feed")
+@route("/news_feed")
 def news_feed():
     """Security news feed page."""
     articles = fetch_rss_news()
     return render_template("news.html", articles=articles)
 
-@app.route("/personal_notes")
+@route("/personal_notes")
 def personal_notes():
     """Personal notes page."""
     conn = db_connect()
@@ -414,7 +455,7 @@ def personal_notes():
     conn.close()
     return render_template("notes.html", notes=[dict(n) for n in notes])
 
-@app.route("/useful_links")
+@route("/useful_links")
 def useful_links():
     """Useful links page."""
     conn = db_connect()
@@ -422,7 +463,7 @@ def useful_links():
     conn.close()
     return render_template("links.html", links=[dict(l) for l in links])
 
-@app.route("/recon")
+@route("/recon")
 def recon():
     """Reconnaissance page."""
     conn = db_connect()
@@ -430,7 +471,7 @@ def recon():
     conn.close()
     return render_template("recon.html", campaigns=[dict(c) for c in campaigns])
 
-@app.route("/attack")
+@route("/attack")
 def attack():
     """Attack scripts page."""
     conn = db_connect()
@@ -438,7 +479,7 @@ def attack():
     conn.close()
     return render_template("attack.html", scripts=[dict(s) for s in scripts])
 
-@app.route("/exploit")
+@route("/exploit")
 def exploit():
     """Exploit scripts page."""
     conn = db_connect()
@@ -450,7 +491,7 @@ def exploit():
 # API Endpoints - Dashboard Stats
 ###############################################################################
 
-@app.route("/api/dashboard/stats")
+@route("/api/dashboard/stats")
 def api_dashboard_stats():
     """API endpoint for dashboard statistics."""
     try:
@@ -463,7 +504,7 @@ def api_dashboard_stats():
 # API Endpoints - Notes
 ###############################################################################
 
-@app.route("/api/notes", methods=["GET", "POST"])
+@route("/api/notes", methods=["GET", "POST"])
 def api_notes():
     """Notes collection endpoint."""
     conn = db_connect()
@@ -482,7 +523,7 @@ def api_notes():
     conn.close()
     return jsonify({"status": "success"}), 201
 
-@app.route("/api/notes/<int:note_id>", methods=["GET", "PUT", "DELETE"])
+@route("/api/notes/<int:note_id>", methods=["GET", "PUT", "DELETE"])
 def api_note(note_id):
     """Single note endpoint."""
     conn = db_connect()
@@ -514,7 +555,7 @@ def api_note(note_id):
 # API Endpoints - Bug Reports
 ###############################################################################
 
-@app.route("/api/bugs", methods=["GET", "POST"])
+@route("/api/bugs", methods=["GET", "POST"])
 def api_bugs():
     """Bug reports collection endpoint."""
     conn = db_connect()
@@ -536,7 +577,7 @@ def api_bugs():
     conn.close()
     return jsonify({"status": "success"}), 201
 
-@app.route("/api/bugs/<int:bug_id>", methods=["GET", "PUT", "DELETE"])
+@route("/api/bugs/<int:bug_id>", methods=["GET", "PUT", "DELETE"])
 def api_bug(bug_id):
     """Single bug report endpoint."""
     conn = db_connect()
@@ -570,7 +611,7 @@ def api_bug(bug_id):
 # API Endpoints - Platforms
 ###############################################################################
 
-@app.route("/api/platforms", methods=["GET", "POST"])
+@route("/api/platforms", methods=["GET", "POST"])
 def api_platforms():
     """Platforms collection endpoint."""
     conn = db_connect()
@@ -590,7 +631,7 @@ def api_platforms():
     conn.close()
     return jsonify({"status": "success"}), 201
 
-@app.route("/api/platforms/<int:platform_id>", methods=["GET", "PUT", "DELETE"])
+@route("/api/platforms/<int:platform_id>", methods=["GET", "PUT", "DELETE"])
 def api_platform(platform_id):
     """Single platform endpoint."""
     conn = db_connect()
@@ -623,7 +664,7 @@ def api_platform(platform_id):
 # API Endpoints - Tips & Tricks
 ###############################################################################
 
-@app.route("/api/tips", methods=["POST"])
+@route("/api/tips", methods=["POST"])
 def api_add_tip():
     """Add a new tip."""
     data = request.get_json()
@@ -640,7 +681,7 @@ def api_add_tip():
 # API Endpoints - News
 ###############################################################################
 
-@app.route("/api/news/add", methods=["POST"])
+@route("/api/news/add", methods=["POST"])
 def api_add_news():
     """Add a new news article."""
     data = request.get_json()
@@ -657,7 +698,7 @@ def api_add_news():
 # API Endpoints - Checklists
 ###############################################################################
 
-@app.route("/api/checklists", methods=["GET", "POST"])
+@route("/api/checklists", methods=["GET", "POST"])
 def api_checklists():
     """Checklists collection endpoint."""
     conn = db_connect()
@@ -680,7 +721,7 @@ def api_checklists():
 # API Endpoints - Reading List
 ###############################################################################
 
-@app.route("/api/reading", methods=["GET", "POST"])
+@route("/api/reading", methods=["GET", "POST"])
 def api_reading_list():
     """Reading list collection endpoint."""
     conn = db_connect()
@@ -703,7 +744,7 @@ def api_reading_list():
 # API Endpoints - Recon Campaigns
 ###############################################################################
 
-@app.route("/api/recon/campaigns", methods=["GET"])
+@route("/api/recon/campaigns", methods=["GET"])
 def api_recon_campaigns():
     """Get recon campaigns."""
     conn = db_connect()
@@ -711,18 +752,74 @@ def api_recon_campaigns():
     conn.close()
     return jsonify({"data": [dict(campaign) for campaign in campaigns]})
 
+@route("/api/campaigns/<int:campaign_id>/report")
+def api_campaign_report(campaign_id):
+    """Render a campaign report (?format=md|html|json)."""
+    import recon_report
+
+    fmt = request.args.get("format", "md")
+    if fmt not in recon_report.REPORT_FORMATS:
+        return jsonify({"error": f"Unsupported format: {fmt}"}), 400
+    conn = db_connect()
+    content = recon_report.campaign_report(conn, campaign_id, fmt)
+    conn.close()
+    if content is None:
+        abort(404)
+    return Response(content, content_type=recon_report.REPORT_MIMETYPES[fmt])
+
 ###############################################################################
 # Error Handlers
 ###############################################################################
 
-@app.errorhandler(404)
+@errorhandler(404)
 def not_found_error(error):
     return render_template('404.html'), 404
 
-@app.errorhandler(500)
+@errorhandler(500)
 def internal_error(error):
     return render_template('500.html'), 500
 
+###############################################################################
+# Application factory
+###############################################################################
+
+def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
+    """Build the dashboard app and bring the database schema up to date."""
+    app = Flask(__name__)
+    app.secret_key = "change-this-secret-key-in-production"
+    if config:
+        app.config.update(config)
+
+    for rule, view, options in _ROUTES:
+        app.add_url_rule(rule, view.__name__, view, **options)
+    for code, handler in _ERROR_HANDLERS:
+        app.register_error_handler(code, handler)
+
+    UPLOAD_DIR.mkdir(exist_ok=True)
+    init_db()
+    return app
+
+def warm_templates(app: Flask) -> None:
+    """Compile every template up front.
+
+    Called in the gunicorn master when preloading, so compiled templates are
+    shared copy-on-write by all workers instead of compiled once per worker.
+    """
+    with app.app_context():
+        for name in app.jinja_env.list_templates(extensions=["html"]):
+            app.jinja_env.get_template(name)
+
+_app: Optional[Flask] = None
+
+def __getattr__(name: str) -> Any:
+    # Keep `dashboard_app_enhanced:app` working without building it at import time
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 ###############################################################################
 # Main
 ###############################################################################
@@ -730,7 +827,7 @@ def internal_error(error):
 if __name__ == "__main__":
     print("🚀 Bug Hunter Enhanced Dashboard starting...")
     print("📍 Initializing database...")
-    init_db()
+    app = create_app()
     print("📍 Access the dashboard at: http://127.0.0.1:5000")
     print("🔧 Debug mode enabled")
     app.run(host='127.0.0.1', port=5000, debug=True)
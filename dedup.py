@@ -0,0 +1,71 @@
+"""
+Bug Hunter Deduplication Helpers
+Streaming "seen before?" checks shared by the DNS engine and URL processor:
+an exact set for small runs that switches to a Bloom filter past a threshold.
+"""
+import math
+import struct
+import hashlib
+from typing import Iterable, Iterator, Optional, Set
+
+###############################################################################
+# Deduplication
+###############################################################################
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (blake2b double hashing)."""
+
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 1e-4):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> bool:
+        """Add item; return True if it was (probably) already present."""
+        present = True
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self.bits[byte] & (1 << bit):
+                present = False
+                self.bits[byte] |= 1 << bit
+        return present
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+class Deduper:
+    """Exact set for small runs that switches to a Bloom filter past a threshold."""
+
+    def __init__(self, exact_limit: int = 1_000_000, capacity: int = 50_000_000, error_rate: float = 1e-4):
+        self.exact_limit = exact_limit
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._seen: Optional[Set[str]] = set()
+        self._bloom: Optional[BloomFilter] = None
+
+    def seen(self, item: str) -> bool:
+        """Record item; return True if it was seen before."""
+        if self._seen is not None:
+            if item in self._seen:
+                return True
+            self._seen.add(item)
+            if len(self._seen) > self.exact_limit:
+                self._bloom = BloomFilter(self.capacity, self.error_rate)
+                for old in self._seen:
+                    self._bloom.add(old)
+                self._seen = None
+            return False
+        return self._bloom.add(item)
+
+def unique(candidates: Iterable[str], deduper: Optional[Deduper] = None) -> Iterator[str]:
+    """Drop repeated candidates from a stream."""
+    deduper = deduper or Deduper()
+    for name in candidates:
+        if not deduper.seen(name):
+            yield name
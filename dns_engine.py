@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Bug Hunter Async DNS Engine
+Brute-force and permutation subdomain resolution over raw UDP DNS,
+spread across a resolver pool with wildcard filtering.
+"""
+import sys
+import time
+import random
+import string
+import struct
+import socket
+import asyncio
+import ipaddress
+import argparse
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Iterator, Set
+
+from dedup import Deduper, unique
+
+###############################################################################
+# Configuration
+###############################################################################
+DEFAULT_RESOLVERS = (
+    "8.8.8.8", "8.8.4.4", "1.1.1.1", "1.0.0.1",
+    "9.9.9.9", "149.112.112.112", "208.67.222.222", "208.67.220.220",
+)
+DEFAULT_WORDLIST = Path("/usr/share/seclists/Discovery/DNS/subdomains-top1million-110000.txt")
+DEFAULT_ALTERATIONS = Path("/usr/share/seclists/Discovery/DNS/alterations.txt")
+
+QTYPE_A = 1
+QTYPE_CNAME = 5
+RCODE_NOERROR = 0
+RCODE_SERVFAIL = 2
+RCODE_NXDOMAIN = 3
+RCODE_REFUSED = 5
+SOCKET_BUFFER = 4 << 20
+
+###############################################################################
+# DNS wire format
+###############################################################################
+
+def encode_name(name: str) -> bytes:
+    """Encode a hostname as DNS labels."""
+    out = bytearray()
+    for label in name.strip(".").split("."):
+        raw = label.encode("idna") if not label.isascii() else label.encode()
+        if not 0 < len(raw) < 64:
+            raise ValueError(f"Invalid DNS label in {name!r}")
+        out.append(len(raw))
+        out += raw
+    out.append(0)
+    return bytes(out)
+
+def build_query(txid: int, name: str, qtype: int = QTYPE_A) -> bytes:
+    """Build a recursive DNS query packet."""
+    return struct.pack("!HHHHHH", txid, 0x0100, 1, 0, 0, 0) + encode_name(name) + struct.pack("!HH", qtype, 1)
+
+def _read_name(packet: bytes, offset: int) -> Tuple[str, int]:
+    """Decode a (possibly compressed) name; return (name, offset after it)."""
+    labels = []
+    end = None
+    for _ in range(128):
+        length = packet[offset]
+        if length & 0xC0 == 0xC0:
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | packet[offset + 1]
+            continue
+        offset += 1
+        if length == 0:
+            break
+        labels.append(packet[offset:offset + length].decode("ascii", "replace"))
+        offset += length
+    else:
+        raise ValueError("DNS name compression loop")
+    return ".".join(labels).lower(), end if end is not None else offset
+
+def parse_response(packet: bytes) -> Dict[str, Any]:
+    """Parse the header, question and A/CNAME answers of a DNS response."""
+    txid, flags, qdcount, ancount, _, _ = struct.unpack_from("!HHHHHH", packet)
+    offset = 12
+    qname = ""
+    for _ in range(qdcount):
+        qname, offset = _read_name(packet, offset)
+        offset += 4
+    addresses: List[str] = []
+    cnames: List[str] = []
+    for _ in range(ancount):
+        _, offset = _read_name(packet, offset)
+        rtype, _, _, rdlength = struct.unpack_from("!HHIH", packet, offset)
+        offset += 10
+        if rtype == QTYPE_A and rdlength == 4:
+            addresses.append(socket.inet_ntoa(packet[offset:offset + 4]))
+        elif rtype == QTYPE_CNAME:
+            cnames.append(_read_name(packet, offset)[0])
+        offset += rdlength
+    return {
+        "id": txid,
+        "rcode": flags & 0x000F,
+        "truncated": bool(flags & 0x0200),
+        "name": qname,
+        "addresses": addresses,
+        "cnames": cnames,
+    }
+
+###############################################################################
+# Candidate producers
+###############################################################################
+
+def iter_words(path: Path) -> Iterator[str]:
+    """Stream normalised words from a wordlist, skipping blanks and comments."""
+    with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+        for line in fh:
+            word = line.strip().lower().strip(".")
+            if word and not word.startswith("#"):
+                yield word
+
+def wordlist_candidates(words: Iterable[str], domain: str) -> Iterator[str]:
+    """Yield <word>.<domain> for each word."""
+    for word in words:
+        yield f"{word}.{domain}"
+
+def permutation_candidates(hosts: Iterable[str], words: List[str], domain: str) -> Iterator[str]:
+    """Yield altdns-style permutations of known hosts under domain.
+
+    For a known ``api.dev.example.com`` and word ``stage`` this yields
+    ``stage.api.dev``, ``api-stage.dev``, ``stage-api.dev``,
+    ``api.stage.dev`` and so on, plus digit increments/decrements such as
+    ``api2`` -> ``api1``/``api3``.
+    """
+    suffix = "." + domain
+    for host in hosts:
+        host = host.strip().lower().strip(".")
+        if not host.endswith(suffix):
+            continue
+        labels = host[:-len(suffix)].split(".")
+        for i, label in enumerate(labels):
+            head, tail = labels[:i], labels[i + 1:]
+            for word in words:
+                for variant in (f"{label}-{word}", f"{word}-{label}", f"{label}{word}", f"{word}{label}"):
+                    yield ".".join(head + [variant] + tail) + suffix
+                yield ".".join(head + [word, label] + tail) + suffix
+                yield ".".join(head + [label, word] + tail) + suffix
+            digits = "".join(ch for ch in label if ch.isdigit())
+            if digits and label.endswith(digits):
+                stem, number = label[:-len(digits)], int(digits)
+                for n in (number - 1, number + 1):
+                    if n >= 0:
+                        yield ".".join(head + [f"{stem}{n}"] + tail) + suffix
+
+###############################################################################
+# Resolver pool
+###############################################################################
+
+class Resolver:
+    """One upstream resolver with a spacing rate limit and failure tracking."""
+
+    def __init__(self, host: str, port: int = 53, rate: float = 100.0):
+        self.addr = (host, port)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self.sent = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+
+    async def acquire(self) -> None:
+        """Wait until this resolver may receive another query."""
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def __repr__(self) -> str:
+        return f"Resolver({self.addr[0]}:{self.addr[1]})"
+
+def parse_resolver(spec: str, rate: float) -> Resolver:
+    """Parse 'ip' or 'ip:port' into a Resolver.
+
+    Only IPv4 resolvers are supported (the engine socket is AF_INET); IPv6
+    and malformed entries raise ValueError.
+    """
+    spec = spec.strip()
+    try:
+        address = ipaddress.ip_address(spec)
+        port = 53
+    except ValueError:
+        host, _, port_text = spec.rpartition(":")
+        address = ipaddress.ip_address(host)
+        if address.version != 4 or not port_text.isdigit() or not 0 < int(port_text) < 65536:
+            raise ValueError(f"Invalid resolver: {spec!r}")
+        port = int(port_text)
+    if address.version != 4:
+        raise ValueError(f"IPv6 resolver not supported: {spec!r}")
+    return Resolver(str(address), port, rate)
+
+def load_resolvers(path: Optional[Path] = None, rate: float = 100.0) -> List[Resolver]:
+    """Load resolvers from a resolvers.txt file (as written by setup_dns_resolvers).
+
+    IPv6 and malformed lines are skipped; the built-in list is used when no
+    usable resolver remains.
+    """
+    resolvers: List[Resolver] = []
+    skipped = 0
+    if path and path.is_file():
+        for line in path.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                resolvers.append(parse_resolver(line, rate))
+            except ValueError:
+                skipped += 1
+    if skipped:
+        print(f"[dns_engine] skipped {skipped} IPv6 or malformed resolver(s) from {path}", file=sys.stderr)
+    return resolvers or [parse_resolver(s, rate) for s in DEFAULT_RESOLVERS]
+
+class _DNSProtocol(asyncio.DatagramProtocol):
+    def __init__(self, engine: "DNSEngine"):
+        self.engine = engine
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.engine._on_datagram(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        pass
+
+class DNSEngine:
+    """Asynchronous A-record resolver spread across a resolver pool.
+
+    Public resolver lists include servers that answer NXDOMAIN with ad or
+    sinkhole addresses. When ``trusted`` resolvers are given, every hit from
+    the pool is re-resolved against them before it is emitted, and wildcard
+    probes go to them as well.
+    """
+
+    def __init__(self, resolvers: List[Resolver], concurrency: int = 500,
+                 timeout: float = 2.0, retries: int = 3, max_failures: int = 25,
+                 trusted: Optional[List[Resolver]] = None):
+        if not resolvers:
+            raise ValueError("At least one resolver is required")
+        self.resolvers = resolvers
+        self.trusted = trusted or None
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.max_failures = max_failures
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._pending: Dict[Tuple[int, Tuple[str, int]], Tuple[str, asyncio.Future]] = {}
+        self._next_id = random.randrange(1 << 16)
+        self._rr = 0
+        self._wildcards: Dict[str, "asyncio.Future[Set[str]]"] = {}
+        self._supervisor: Optional[asyncio.Task] = None
+        self.stats = {"queries": 0, "timeouts": 0, "resolved": 0, "wildcard_filtered": 0, "invalid": 0,
+                      "unverified": 0, "cname_only": 0}
+
+    async def __aenter__(self) -> "DNSEngine":
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DNSProtocol(self), local_addr=("0.0.0.0", 0))
+        sock = self._transport.get_extra_info("socket")
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER)
+        except OSError:
+            pass
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def _on_datagram(self, data: bytes, addr: Tuple[str, int]) -> None:
+        try:
+            txid = struct.unpack_from("!H", data)[0]
+        except struct.error:
+            return
+        pending = self._pending.get((txid, (addr[0], addr[1])))
+        if pending is None:
+            return
+        name, future = pending
+        try:
+            response = parse_response(data)
+        except (ValueError, IndexError, struct.error):
+            return
+        if response["name"] != name or future.done():
+            return
+        future.set_result(response)
+
+    def _pick_resolver(self, exclude: Optional[Resolver], pool: List[Resolver]) -> Resolver:
+        healthy = [r for r in pool if r.consecutive_failures < self.max_failures] or pool
+        for _ in range(len(healthy)):
+            self._rr = (self._rr + 1) % len(healthy)
+            resolver = healthy[self._rr]
+            if resolver is not exclude or len(healthy) == 1:
+                return resolver
+        return healthy[0]
+
+    def _allocate_id(self, addr: Tuple[str, int]) -> int:
+        for _ in range(1 << 16):
+            self._next_id = (self._next_id + 1) & 0xFFFF
+            if (self._next_id, addr) not in self._pending:
+                return self._next_id
+        raise RuntimeError("DNS transaction ids exhausted")
+
+    async def query(self, name: str, trusted: bool = False) -> Optional[Dict[str, Any]]:
+        """Resolve name; return the parsed response or None after all retries fail.
+
+        With ``trusted`` the query goes to the trusted resolvers (if any)
+        instead of the main pool.
+        """
+        name = name.lower().strip(".")
+        loop = asyncio.get_running_loop()
+        pool = self.trusted if trusted and self.trusted else self.resolvers
+        resolver = None
+        for _ in range(self.retries + 1):
+            resolver = self._pick_resolver(resolver, pool)
+            await resolver.acquire()
+            txid = self._allocate_id(resolver.addr)
+            key = (txid, resolver.addr)
+            future = loop.create_future()
+            self._pending[key] = (name, future)
+            try:
+                self._transport.sendto(build_query(txid, name), resolver.addr)
+                resolver.sent += 1
+                self.stats["queries"] += 1
+                response = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                response = None
+            finally:
+                del self._pending[key]
+            if response is None or response["rcode"] in (RCODE_SERVFAIL, RCODE_REFUSED) or response["truncated"]:
+                resolver.failures += 1
+                resolver.consecutive_failures += 1
+                continue
+            resolver.consecutive_failures = 0
+            return response
+        return None
+
+    async def lookup(self, name: str, trusted: bool = False) -> Optional[Tuple[List[str], List[str]]]:
+        """Return (addresses, cname chain) of name, or None if it does not exist.
+
+        CNAME-only answers and dangling CNAMEs (NXDOMAIN with a CNAME in the
+        answer section) are returned with no addresses: they are subdomain
+        takeover leads.
+        """
+        response = await self.query(name, trusted)
+        if not response:
+            return None
+        addresses, cnames = response["addresses"], response["cnames"]
+        if response["rcode"] == RCODE_NOERROR and (addresses or cnames):
+            return addresses, cnames
+        if response["rcode"] == RCODE_NXDOMAIN and cnames:
+            return [], cnames
+        return None
+
+    async def resolve(self, name: str, trusted: bool = False) -> Optional[List[str]]:
+        """Return the A records of name, or None if it does not resolve."""
+        found = await self.lookup(name, trusted)
+        return found[0] if found and found[0] else None
+
+    async def _probe_wildcard(self, zone: str, probes: int) -> Set[str]:
+        records: Set[str] = set()
+        for _ in range(probes):
+            label = "".join(random.choices(string.ascii_lowercase + string.digits, k=16))
+            found = await self.lookup(f"{label}.{zone}", trusted=True)
+            if found:
+                records.update(found[0])
+                records.update(found[1])
+        return records
+
+    async def wildcard_records(self, zone: str, probes: int = 3) -> Set[str]:
+        """Addresses and CNAME targets returned for random names under zone (cached per zone)."""
+        future = self._wildcards.get(zone)
+        if future is None:
+            future = asyncio.ensure_future(self._probe_wildcard(zone, probes))
+            self._wildcards[zone] = future
+        return await future
+
+    async def run(self, candidates: Iterable[str], check_wildcards: bool = True) -> "asyncio.Queue":
+        """Resolve candidates; results are put on the returned queue as (name, addresses, cnames).
+
+        A final ``None`` marks the end of the stream; call :meth:`join` after
+        it to re-raise any error that stopped the workers early. Candidates
+        that are not valid DNS names are skipped and counted in
+        ``stats["invalid"]``; pool hits the trusted resolvers do not confirm
+        are dropped and counted in ``stats["unverified"]``. Names with a
+        CNAME but no addresses are emitted too and counted in
+        ``stats["cname_only"]``.
+        """
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 4)
+        iterator = iter(candidates)
+
+        async def worker() -> None:
+            for name in iterator:
+                try:
+                    encode_name(name)
+                except ValueError:
+                    self.stats["invalid"] += 1
+                    continue
+                found = await self.lookup(name)
+                if not found:
+                    continue
+                if self.trusted:
+                    found = await self.lookup(name, trusted=True)
+                    if not found:
+                        self.stats["unverified"] += 1
+                        continue
+                addresses, cnames = found
+                if check_wildcards:
+                    zone = name.split(".", 1)[1] if "." in name else name
+                    wildcard = await self.wildcard_records(zone)
+                    if wildcard and set(addresses) | set(cnames) <= wildcard:
+                        self.stats["wildcard_filtered"] += 1
+                        continue
+                self.stats["resolved"] += 1
+                if not addresses:
+                    self.stats["cname_only"] += 1
+                await results.put((name, addresses, cnames))
+
+        async def supervisor() -> None:
+            workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+            finally:
+                await results.put(None)
+
+        self._supervisor = asyncio.ensure_future(supervisor())
+        return results
+
+    async def join(self) -> None:
+        """Wait for the last run() to finish and re-raise its error, if any."""
+        if self._supervisor is not None:
+            supervisor, self._supervisor = self._supervisor, None
+            await supervisor
+
+async def resolve_all(engine: DNSEngine, candidates: Iterable[str],
+                      check_wildcards: bool = True) -> Dict[str, Tuple[List[str], List[str]]]:
+    """Drain engine.run() into a dict of name -> (addresses, cnames)."""
+    found: Dict[str, Tuple[List[str], List[str]]] = {}
+    queue = await engine.run(candidates, check_wildcards)
+    while True:
+        item = await queue.get()
+        if item is None:
+            await engine.join()
+            return found
+        found[item[0]] = (item[1], item[2])
+
+###############################################################################
+# Main
+###############################################################################
+
+async def _main_async(args: argparse.Namespace) -> int:
+    resolvers = load_resolvers(args.resolvers, args.rate)
+    trusted = None
+    if not args.no_verify:
+        trusted = load_resolvers(args.trusted_resolvers, args.rate)
+        if {r.addr for r in trusted} == {r.addr for r in resolvers}:
+            trusted = None
+    deduper = Deduper()
+    streams: List[Iterable[str]] = []
+    if args.wordlist:
+        streams.append(wordlist_candidates(iter_words(args.wordlist), args.domain))
+    if args.permute:
+        words = list(iter_words(args.alterations))
+        hosts = list(iter_words(args.permute))
+        for host in hosts:
+            deduper.seen(host)
+        streams.append(permutation_candidates(hosts, words, args.domain))
+    if not streams:
+        print("Nothing to resolve: pass --wordlist and/or --permute", file=sys.stderr)
+        return 1
+
+    def chained() -> Iterator[str]:
+        for stream in streams:
+            yield from stream
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    cname_out = open(args.cnames, "w") if args.cnames else None
+    started = time.monotonic()
+    try:
+        async with DNSEngine(resolvers, args.concurrency, args.timeout, args.retries,
+                             trusted=trusted) as engine:
+            queue = await engine.run(unique(chained(), deduper), not args.no_wildcard_filter)
+            while True:
+                item = await queue.get()
+                if item is None:
+                    await engine.join()
+                    break
+                name, addresses, cnames = item
+                if args.with_ips:
+                    line = f"{name} {','.join(addresses) or '-'}"
+                    out.write(f"{line} cname={','.join(cnames)}\n" if cnames else f"{line}\n")
+                else:
+                    out.write(f"{name}\n")
+                out.flush()
+                if cname_out and cnames:
+                    cname_out.write(f"{name}\t{','.join(cnames)}\t{'resolved' if addresses else 'dangling'}\n")
+                    cname_out.flush()
+            elapsed = time.monotonic() - started
+            print(f"[dns_engine] {engine.stats['queries']} queries in {elapsed:.1f}s "
+                  f"({engine.stats['queries'] / max(elapsed, 1e-9):.0f} qps), "
+                  f"{engine.stats['resolved']} resolved, {engine.stats['wildcard_filtered']} wildcard filtered, "
+                  f"{engine.stats['unverified']} unverified, {engine.stats['cname_only']} cname-only, "
+                  f"{engine.stats['invalid']} invalid skipped",
+                  file=sys.stderr)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if cname_out:
+            cname_out.close()
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Async DNS brute-force and permutation resolver")
+    parser.add_argument("-d", "--domain", required=True)
+    parser.add_argument("-w", "--wordlist", type=Path, help="Brute-force wordlist")
+    parser.add_argument("-p", "--permute", type=Path, help="Known subdomains to permute")
+    parser.add_argument("-a", "--alterations", type=Path, default=DEFAULT_ALTERATIONS)
+    parser.add_argument("-r", "--resolvers", type=Path, help="resolvers.txt (ip or ip:port per line)")
+    parser.add_argument("-t", "--trusted-resolvers", type=Path,
+                        help="Resolvers used to verify hits (default: built-in public resolvers)")
+    parser.add_argument("--no-verify", action="store_true", help="Emit pool hits without trusted re-resolution")
+    parser.add_argument("-o", "--output", type=Path)
+    parser.add_argument("-c", "--concurrency", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=100.0, help="Queries per second per resolver (0 = unlimited)")
+    parser.add_argument("--timeout", type=float, default=2.0)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--no-wildcard-filter", action="store_true")
+    parser.add_argument("--with-ips", action="store_true",
+                        help="Append resolved addresses (and cname=chain) to each line")
+    parser.add_argument("--cnames", type=Path,
+                        help="Write name<TAB>cname chain<TAB>resolved|dangling for every CNAME hit")
+    args = parser.parse_args(argv)
+    args.domain = args.domain.lower().strip(".")
+    return asyncio.run(_main_async(args))
+
+if __name__ == "__main__":
+    raise SystemExit(main())
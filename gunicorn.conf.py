@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the Bug Hunter dashboard.
+
+    gunicorn -c gunicorn.conf.py
+
+The app is built once in the master (preload_app) and forked into workers.
+Before forking, templates are compiled and the heap is frozen out of the
+cyclic GC so worker collections do not dirty the shared pages.
+"""
+import gc
+import os
+
+wsgi_app = "dashboard_app_enhanced:create_app()"
+bind = os.environ.get("BUGHUNTER_BIND", "127.0.0.1:5000")
+workers = int(os.environ.get("BUGHUNTER_WORKERS", "2"))
+preload_app = os.environ.get("BUGHUNTER_PRELOAD", "1") == "1"
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+    from dashboard_app_enhanced import warm_templates
+    warm_templates(server.app.wsgi())
+    gc.collect()
+    gc.freeze()
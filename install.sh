@@ -75,8 +75,8 @@ install_python() {
     log "Installing Python3 and pip..."
     sudo apt install -y python3 python3-pip python3-venv
 
-    # Install Flask and other Python dependencies
-    pip3 install flask sqlite3 requests beautifulsoup4 lxml
+    # Install Flask, gunicorn and other Python dependencies (sqlite3 ships with Python)
+    pip3 install -r requirements.txt beautifulsoup4 lxml
 }
 
 # Install reconnaissance tools
@@ -201,10 +201,11 @@ setup_project() {
 
     # Copy files to project directory
     cp recon_script.sh ~/bug-hunter-platform/scripts/
-    cp dashboard_app.py ~/bug-hunter-platform/
-    cp -r templates ~/bug-hunter-platform/
+    cp dashboard_app_enhanced.py gunicorn.conf.py recon_report.py dns_engine.py url_processor.py dedup.py ~/bug-hunter-platform/
+    cp -r templates static ~/bug-hunter-platform/
 
     # Create configuration file
+    mkdir -p ~/.config/bug-hunter
     cat > ~/.config/bug-hunter/config.conf << EOF
 # Bug Hunter Platform Configuration
 RESULTS_DIR=~/bug-hunter-platform/results
@@ -218,8 +219,6 @@ CENSYS_API_ID=
 CENSYS_API_SECRET=
 GITHUB_TOKEN=
 EOF
-
-    mkdir -p ~/.config/bug-hunter
 }
 
 # Configure DNS resolvers
@@ -249,17 +248,18 @@ create_shortcuts() {
     log "Creating shortcuts..."
 
     # Create bash alias
-    echo 'alias bug-hunter="cd ~/bug-hunter-platform && python3 dashboard_app.py"' >> ~/.bashrc
+    echo 'alias bug-hunter="cd ~/bug-hunter-platform && python3 -m gunicorn -c gunicorn.conf.py"' >> ~/.bashrc
     echo 'alias recon="~/bug-hunter-platform/scripts/recon_script.sh"' >> ~/.bashrc
 
     # Create desktop file
+    mkdir -p ~/Desktop
     cat > ~/Desktop/bug-hunter.desktop << EOF
 [Desktop Entry]
 Version=1.0
 Type=Application
 Name=Bug Hunter Dashboard
 Comment=Local bug bounty reconnaissance dashboard
-Exec=gnome-terminal -- bash -c "cd ~/bug-hunter-platform && python3 dashboard_app.py; exec bash"
+Exec=gnome-terminal -- bash -c "cd ~/bug-hunter-platform && python3 -m gunicorn -c gunicorn.conf.py; exec bash"
 Icon=applications-internet
 Terminal=false
 Categories=Security;Network;
@@ -290,7 +290,7 @@ verify_installation() {
     fi
 
     # Check Python dependencies
-    python3 -c "import flask, sqlite3, requests; print('✅ Python dependencies OK')" 2>/dev/null || warning "❌ Python dependencies missing"
+    python3 -c "import flask, gunicorn, feedparser, sqlite3, requests; print('✅ Python dependencies OK')" 2>/dev/null || warning "❌ Python dependencies missing"
 }
 
 # Main installation function
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Bug Hunter Recon Report Engine
+Builds campaign reports (Markdown, HTML, JSON) from the dashboard database
+or straight from a recon_script.sh results directory.
+"""
+import os
+import json
+import html
+import sqlite3
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Sequence, Union
+
+###############################################################################
+# Configuration
+###############################################################################
+BASE_DIR = Path(__file__).resolve().parent
+DB_PATH = Path(os.environ.get("BUGHUNTER_DB", BASE_DIR / "bug_hunter_enhanced.db"))
+RESULTS_DIR = BASE_DIR / "results"
+
+REPORT_FORMATS = ("md", "html", "json")
+REPORT_MIMETYPES = {
+    "md": "text/markdown; charset=utf-8",
+    "html": "text/html; charset=utf-8",
+    "json": "application/json",
+}
+
+# (key, label, path relative to the campaign results directory)
+SUBDOMAIN_FILES = (
+    ("admin_panels", "Admin panels", "02_subdomain_enum/categories/admin_panels.txt"),
+    ("apis", "APIs detected", "02_subdomain_enum/categories/apis.txt"),
+    ("development", "Development environments", "02_subdomain_enum/categories/development.txt"),
+    ("mail_servers", "Mail servers", "02_subdomain_enum/categories/mail_servers.txt"),
+)
+SECURITY_FILES = (
+    ("nuclei", "Nuclei vulnerabilities", "06_vulnerability_scan/nuclei/nuclei_results.txt"),
+    ("nuclei_dast", "Nuclei DAST findings", "06_vulnerability_scan/nuclei/nuclei_dast_results.txt"),
+    ("takeovers", "Potential subdomain takeovers", "06_vulnerability_scan/nuclei/subjack_results.txt"),
+    ("js_secrets", "JavaScript secrets", "06_vulnerability_scan/secrets/js_secrets.txt"),
+)
+COUNT_FILES = (
+    ("subdomains", "02_subdomain_enum/passive_combined.txt"),
+    ("live_hosts", "03_host_discovery/alive/live_hosts.txt"),
+)
+
+# Only these files are line-counted; everything else just contributes size
+COUNTED_FILES = frozenset(
+    [rel for _, rel in COUNT_FILES]
+    + [rel for _, _, rel in SUBDOMAIN_FILES]
+    + [rel for _, _, rel in SECURITY_FILES]
+)
+
+RECOMMENDATIONS = (
+    "Review all discovered admin panels and development environments",
+    "Analyze high-priority vulnerabilities from Nuclei scan",
+    "Investigate potential subdomain takeover opportunities",
+    "Review exposed secrets in JavaScript files",
+    "Perform manual testing on high-value targets",
+)
+
+###############################################################################
+# File statistics cache
+###############################################################################
+
+# (path, size, mtime_ns) -> (lines, bytes). Result files are append-only while a
+# scan runs and immutable afterwards, so the key changes whenever content does.
+_STATS_CACHE: Dict[Tuple[str, int, int], Tuple[int, int]] = {}
+_STATS_CACHE_MAX = 4096
+_CHUNK_SIZE = 1 << 20
+
+def count_lines(path: Path) -> int:
+    """Count lines in a file, including a final unterminated line."""
+    lines = 0
+    last = b"\n"
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    return lines + (0 if last == b"\n" else 1)
+
+def file_stats(path: Path, st: Optional[os.stat_result] = None) -> Tuple[int, int]:
+    """Return (lines, bytes) for a file, cached by (path, size, mtime)."""
+    if st is None:
+        st = os.stat(path)
+    key = (str(path), st.st_size, st.st_mtime_ns)
+    cached = _STATS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    stats = (count_lines(path) if st.st_size else 0, st.st_size)
+    if len(_STATS_CACHE) >= _STATS_CACHE_MAX:
+        _STATS_CACHE.clear()
+    _STATS_CACHE[key] = stats
+    return stats
+
+def clear_stats_cache() -> None:
+    """Drop all cached file statistics."""
+    _STATS_CACHE.clear()
+
+def iter_result_files(root: Path) -> Iterable[Tuple[str, os.DirEntry]]:
+    """Yield (relative_path, entry) for every regular file under root."""
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    rel = prefix + entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), rel + "/"))
+                    elif entry.is_file(follow_symlinks=False):
+                        yield rel, entry
+        except OSError:
+            continue
+
+def scan_results(root: Path, counted: Iterable[str] = COUNTED_FILES) -> Dict[str, Any]:
+    """Collect per-phase sizes in one pass over root.
+
+    Only files listed in ``counted`` are read for line counts, so large crawl
+    and wayback output costs a stat() rather than a full read.
+    """
+    counted = frozenset(counted)
+    files: Dict[str, Dict[str, int]] = {}
+    phases: Dict[str, Dict[str, int]] = {}
+    for rel, entry in iter_result_files(root):
+        try:
+            st = entry.stat()
+            if rel in counted:
+                files[rel] = dict(zip(("lines", "bytes"), file_stats(Path(entry.path), st)))
+        except OSError:
+            continue
+        phase = rel.split("/", 1)[0] if "/" in rel else "."
+        totals = phases.setdefault(phase, {"files": 0, "bytes": 0})
+        totals["files"] += 1
+        totals["bytes"] += st.st_size
+    return {"files": files, "phases": dict(sorted(phases.items()))}
+
+###############################################################################
+# Report building
+###############################################################################
+
+def find_campaign_dir(campaign: Dict[str, Any], results_dir: Path = RESULTS_DIR) -> Optional[Path]:
+    """Locate the results directory of a campaign row."""
+    log_path = campaign.get("log_path")
+    if log_path:
+        candidate = Path(log_path)
+        for directory in (candidate, candidate.parent, candidate.parent.parent):
+            if (directory / "02_subdomain_enum").is_dir():
+                return directory
+    target = campaign.get("target_domain")
+    if not target:
+        return None
+    target_dir = results_dir / target
+    try:
+        runs = sorted(p for p in target_dir.iterdir() if p.is_dir())
+    except OSError:
+        return None
+    return runs[-1] if runs else None
+
+def _line_count(scan: Dict[str, Any], rel: str) -> int:
+    entry = scan["files"].get(rel)
+    return entry["lines"] if entry else 0
+
+def build_report(campaign: Optional[Dict[str, Any]] = None,
+                 results_dir: Optional[Path] = None,
+                 **overrides: Any) -> Dict[str, Any]:
+    """Build a report dict from a campaign row, a results directory, or both.
+
+    Values in ``overrides`` (target, scope, duration, ...) take precedence,
+    which lets recon_script.sh pass the numbers it already has in memory.
+    """
+    campaign = dict(campaign or {})
+    if results_dir is None and campaign:
+        results_dir = find_campaign_dir(campaign)
+    scan = scan_results(results_dir) if results_dir and results_dir.is_dir() else {"files": {}, "phases": {}}
+
+    counts = {key: _line_count(scan, rel) for key, rel in COUNT_FILES}
+    report = {
+        "campaign_id": campaign.get("id"),
+        "target": campaign.get("target_domain") or (results_dir.resolve().parent.name if results_dir else ""),
+        "status": campaign.get("status"),
+        "scope_size": campaign.get("scope_size") or "",
+        "scan_date": campaign.get("created_at") or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "duration": None,
+        "subdomain_count": campaign.get("subdomain_count") or counts["subdomains"],
+        "live_host_count": campaign.get("live_host_count") or counts["live_hosts"],
+        "subdomain_findings": [
+            {"key": key, "label": label, "count": _line_count(scan, rel)}
+            for key, label, rel in SUBDOMAIN_FILES
+        ],
+        "security_findings": [
+            {"key": key, "label": label, "count": _line_count(scan, rel)}
+            for key, label, rel in SECURITY_FILES
+        ],
+        "recommendations": list(RECOMMENDATIONS),
+        "results_dir": str(results_dir) if results_dir else None,
+        "phases": scan["phases"],
+        "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    report.update({k: v for k, v in overrides.items() if v not in (None, "")})
+    return report
+
+###############################################################################
+# Renderers
+###############################################################################
+
+def render_markdown(report: Dict[str, Any]) -> str:
+    """Render a report as Markdown (same layout as the legacy shell report)."""
+    out = [f"# Reconnaissance Report for {report['target']}", "", "## Executive Summary"]
+    out.append(f"- **Target**: {report['target']}")
+    out.append(f"- **Scope Classification**: {report['scope_size']}")
+    out.append(f"- **Scan Date**: {report['scan_date']}")
+    if report.get("duration") is not None:
+        out.append(f"- **Scan Duration**: {report['duration']} seconds")
+    out.append(f"- **Subdomains Found**: {report['subdomain_count']}")
+    out.append(f"- **Live Hosts**: {report['live_host_count']}")
+    out += ["", "## Key Findings", "", "### Subdomains Discovered"]
+    out.append(f"- Total subdomains: {report['subdomain_count']}")
+    out.append(f"- Live hosts: {report['live_host_count']}")
+    out += [f"- {f['label']}: {f['count']}" for f in report["subdomain_findings"]]
+    out += ["", "### Security Findings"]
+    out += [f"- {f['label']}: {f['count']}" for f in report["security_findings"]]
+    out += ["", "### Recommendations"]
+    out += [f"{i}. {r}" for i, r in enumerate(report["recommendations"], 1)]
+    if report["phases"]:
+        out += ["", "## Result Files", "", "| Phase | Files | Bytes |", "|---|---|---|"]
+        out += [f"| {name} | {p['files']} | {p['bytes']} |" for name, p in report["phases"].items()]
+    if report.get("results_dir"):
+        base = report["results_dir"]
+        out += ["", "## File Locations"]
+        out.append(f"- All scan results: {base}")
+        out.append(f"- Live hosts: {base}/03_host_discovery/alive/live_hosts.txt")
+        out.append(f"- Vulnerability scan: {base}/06_vulnerability_scan/")
+        out.append(f"- Technology stack: {base}/08_technology_stack/")
+    return "\n".join(out) + "\n"
+
+def render_html(report: Dict[str, Any]) -> str:
+    """Render a report as a standalone HTML page."""
+    e = lambda value: html.escape(str(value))
+    items = lambda rows: "".join(f"<li>{e(label)}: <strong>{e(count)}</strong></li>" for label, count in rows)
+    summary = [
+        ("Target", report["target"]),
+        ("Scope Classification", report["scope_size"]),
+        ("Scan Date", report["scan_date"]),
+        ("Subdomains Found", report["subdomain_count"]),
+        ("Live Hosts", report["live_host_count"]),
+    ]
+    if report.get("duration") is not None:
+        summary.insert(3, ("Scan Duration", f"{report['duration']} seconds"))
+    parts = [
+        "<!DOCTYPE html>",
+        f"<html><head><meta charset=\"utf-8\"><title>Reconnaissance Report for {e(report['target'])}</title></head><body>",
+        f"<h1>Reconnaissance Report for {e(report['target'])}</h1>",
+        "<h2>Executive Summary</h2>",
+        f"<ul>{items(summary)}</ul>",
+        "<h2>Key Findings</h2>",
+        "<h3>Subdomains Discovered</h3>",
+        f"<ul>{items((f['label'], f['count']) for f in report['subdomain_findings'])}</ul>",
+        "<h3>Security Findings</h3>",
+        f"<ul>{items((f['label'], f['count']) for f in report['security_findings'])}</ul>",
+        "<h3>Recommendations</h3>",
+        "<ol>" + "".join(f"<li>{e(r)}</li>" for r in report["recommendations"]) + "</ol>",
+    ]
+    if report["phases"]:
+        parts.append("<h2>Result Files</h2><table><tr><th>Phase</th><th>Files</th><th>Bytes</th></tr>")
+        parts += [
+            f"<tr><td>{e(name)}</td><td>{p['files']}</td><td>{p['bytes']}</td></tr>"
+            for name, p in report["phases"].items()
+        ]
+        parts.append("</table>")
+    if report.get("results_dir"):
+        parts.append(f"<p>All scan results: <code>{e(report['results_dir'])}</code></p>")
+    parts.append(f"<p><small>Generated {e(report['generated_at'])}</small></p></body></html>")
+    return "\n".join(parts) + "\n"
+
+def render_json(report: Dict[str, Any]) -> str:
+    """Render a report as JSON."""
+    return json.dumps(report, indent=2, default=str)
+
+RENDERERS = {"md": render_markdown, "html": render_html, "json": render_json}
+
+def parse_formats(value: Union[str, Sequence[str]]) -> List[str]:
+    """Normalise 'md,html' or ['md', 'html'] into a validated list of formats."""
+    formats = value.split(",") if isinstance(value, str) else list(value)
+    formats = [f.strip() for f in formats if f.strip()]
+    unknown = [f for f in formats if f not in RENDERERS]
+    if unknown or not formats:
+        raise ValueError(f"Unknown report format: {','.join(unknown) or value!r}")
+    return list(dict.fromkeys(formats))
+
+def render_report(report: Dict[str, Any], fmt: str = "md") -> str:
+    """Render a report dict in one of REPORT_FORMATS."""
+    if fmt not in RENDERERS:
+        raise ValueError(f"Unknown report format: {fmt}")
+    return RENDERERS[fmt](report)
+
+###############################################################################
+# Campaign lookups and batch generation
+###############################################################################
+
+def load_campaign(conn: sqlite3.Connection, campaign_id: int) -> Optional[Dict[str, Any]]:
+    """Fetch a recon campaign row as a dict."""
+    cursor = conn.execute("SELECT * FROM recon_campaigns WHERE id = ?", (campaign_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+def campaign_report(conn: sqlite3.Connection, campaign_id: int, fmt: str = "md") -> Optional[str]:
+    """Render the report for one campaign, or None if it does not exist."""
+    campaign = load_campaign(conn, campaign_id)
+    if campaign is None:
+        return None
+    return render_report(build_report(campaign), fmt)
+
+def write_reports(report: Dict[str, Any], formats: Sequence[str], stem: Path) -> List[str]:
+    """Render one report dict in several formats as <stem>.<fmt>."""
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for fmt in formats:
+        path = stem.with_name(f"{stem.name}.{fmt}")
+        path.write_text(render_report(report, fmt), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+def _batch_worker(args: Tuple[str, int, List[str], str]) -> Tuple[int, Optional[List[str]]]:
+    db_path, campaign_id, formats, out_dir = args
+    conn = sqlite3.connect(db_path)
+    try:
+        campaign = load_campaign(conn, campaign_id)
+    finally:
+        conn.close()
+    if campaign is None:
+        return campaign_id, None
+    return campaign_id, write_reports(build_report(campaign), formats, Path(out_dir) / f"campaign_{campaign_id}_report")
+
+def generate_reports(campaign_ids: List[int], fmt: Union[str, Sequence[str]] = "md", out_dir: Path = BASE_DIR / "reports",
+                     db_path: Path = DB_PATH, max_workers: Optional[int] = None) -> Dict[int, Optional[List[str]]]:
+    """Render many campaign reports in a process pool.
+
+    ``fmt`` may name several formats ('md,html,json'); each campaign is
+    scanned once and rendered in all of them. Returns a mapping of campaign
+    id to the written file paths (None for unknown campaigns).
+    """
+    formats = parse_formats(fmt)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = [(str(db_path), cid, formats, str(out_dir)) for cid in campaign_ids]
+    if len(jobs) <= 1 or max_workers == 1:
+        return dict(map(_batch_worker, jobs))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return dict(pool.map(_batch_worker, jobs, chunksize=max(1, len(jobs) // 32)))
+
+###############################################################################
+# Main
+###############################################################################
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate Bug Hunter recon campaign reports")
+    parser.add_argument("-r", "--results", type=Path, help="Results directory of a single scan")
+    parser.add_argument("-c", "--campaign", type=int, action="append", default=[], help="Campaign id (repeatable)")
+    parser.add_argument("--all", action="store_true", help="Report on every campaign in the database")
+    parser.add_argument("-f", "--format", default="md",
+                        help=f"Comma-separated formats from {', '.join(REPORT_FORMATS)} (default: md)")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="Output file (one format), output stem written as <stem>.<fmt> (several formats), "
+                             "or directory (batch)")
+    parser.add_argument("--db", type=Path, default=DB_PATH)
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes for batch mode")
+    parser.add_argument("--target")
+    parser.add_argument("--scope")
+    parser.add_argument("--duration", type=int)
+    parser.add_argument("--subdomains", type=int)
+    parser.add_argument("--live-hosts", type=int)
+    args = parser.parse_args(argv)
+    try:
+        formats = parse_formats(args.format)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.results:
+        report = build_report(
+            results_dir=args.results, target=args.target, scope_size=args.scope, duration=args.duration,
+            subdomain_count=args.subdomains, live_host_count=args.live_hosts,
+        )
+        if len(formats) > 1:
+            if not args.output:
+                parser.error("--output stem is required with several formats")
+            stem = args.output.with_suffix("") if args.output.suffix.lstrip(".") in RENDERERS else args.output
+            write_reports(report, formats, stem)
+        elif args.output:
+            args.output.write_text(render_report(report, formats[0]), encoding="utf-8")
+        else:
+            print(render_report(report, formats[0]), end="")
+        return 0
+
+    ids = list(args.campaign)
+    if args.all:
+        conn = sqlite3.connect(args.db)
+        ids += [row[0] for row in conn.execute("SELECT id FROM recon_campaigns ORDER BY id")]
+        conn.close()
+    if not ids:
+        parser.error("one of --results, --campaign or --all is required")
+    written = generate_reports(ids, formats, args.output or BASE_DIR / "reports", args.db, args.jobs)
+    for cid, paths in written.items():
+        print(f"campaign {cid}: {', '.join(paths) if paths else 'not found'}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
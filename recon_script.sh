@@ -21,6 +21,7 @@ SCOPE_SIZE=""
 SUBDOMAIN_COUNT=0
 LIVE_HOST_COUNT=0
 START_TIME=$(date +%s)
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Banner function
 banner() {
@@ -50,6 +51,18 @@ info() {
     echo -e "${BLUE}[INFO] $1${NC}"
 }
 
+# Locate a bundled Python helper (next to this script or one level up)
+find_python_module() {
+    local candidate
+    for candidate in "$SCRIPT_DIR/$1" "$SCRIPT_DIR/../$1"; do
+        if [ -f "$candidate" ] && command -v python3 &> /dev/null; then
+            echo "$candidate"
+            return 0
+        fi
+    done
+    return 1
+}
+
 # Check dependencies module
 check_dependencies() {
     log "Checking dependencies..."
@@ -229,14 +242,23 @@ module_osint() {
     # theHarvester for email and host enumeration
     theHarvester -d "$TARGET" -b google,bing,duckduckgo -l 500 -f "$OUTPUT_DIR/07_intelligence/osint/theharvester_$TARGET" 2>/dev/null
 
-    # Wayback URLs
-    waybackurls "$TARGET" | head -10000 > "$OUTPUT_DIR/07_intelligence/wayback/wayback_urls.txt" 2>/dev/null
+    local url_processor
+    if url_processor=$(find_python_module url_processor.py); then
+        # Stream full wayback/gau output through normalization and clustering
+        { waybackurls "$TARGET" 2>/dev/null; gau "$TARGET" 2>/dev/null; } | python3 "$url_processor" \
+            -o "$OUTPUT_DIR/07_intelligence/wayback/combined_urls.txt" \
+            -p "$OUTPUT_DIR/07_intelligence/wayback/parameters.txt" \
+            --param-counts "$OUTPUT_DIR/07_intelligence/wayback/parameter_frequency.txt"
+    else
+        # Wayback URLs
+        waybackurls "$TARGET" | head -10000 > "$OUTPUT_DIR/07_intelligence/wayback/wayback_urls.txt" 2>/dev/null
 
-    # GAU for additional URLs
-    gau "$TARGET" | head -10000 > "$OUTPUT_DIR/07_intelligence/wayback/gau_urls.txt" 2>/dev/null
+        # GAU for additional URLs
+        gau "$TARGET" | head -10000 > "$OUTPUT_DIR/07_intelligence/wayback/gau_urls.txt" 2>/dev/null
 
-    # Combine wayback data
-    cat "$OUTPUT_DIR/07_intelligence/wayback/"*.txt | sort -u > "$OUTPUT_DIR/07_intelligence/wayback/combined_urls.txt"
+        # Combine wayback data
+        cat "$OUTPUT_DIR/07_intelligence/wayback/"*.txt | sort -u > "$OUTPUT_DIR/07_intelligence/wayback/combined_urls.txt"
+    fi
 
     log "OSINT collection completed"
 }
@@ -248,15 +270,45 @@ module_slow_subdomain_enum() {
     # Amass passive enumeration
     amass enum -passive -d "$TARGET" -o "$OUTPUT_DIR/02_subdomain_enum/passive/amass.txt" 2>/dev/null
 
-    # Active DNS brute forcing with common wordlist
-    if command -v ffuf &> /dev/null; then
-        # Use ffuf for DNS fuzzing if available
-        ffuf -w /usr/share/seclists/Discovery/DNS/subdomains-top1million-110000.txt:FUZZ -u "http://FUZZ.$TARGET" -mc 200,204,301,302,307,401,403,405,500 -o "$OUTPUT_DIR/02_subdomain_enum/active/ffuf_dns.json" -of json -t 50 2>/dev/null
-    fi
+    local dns_engine
+    if dns_engine=$(find_python_module dns_engine.py); then
+        # Native async DNS brute force and permutations across the resolver pool
+        python3 "$dns_engine" -d "$TARGET" -r "$OUTPUT_DIR/resolvers.txt" \
+            -w /usr/share/seclists/Discovery/DNS/subdomains-top1million-110000.txt \
+            -o "$OUTPUT_DIR/02_subdomain_enum/active/dns_bruteforce.txt" \
+            --cnames "$OUTPUT_DIR/02_subdomain_enum/active/dns_cnames.txt"
+
+        if [ -f "$OUTPUT_DIR/02_subdomain_enum/passive_combined.txt" ]; then
+            python3 "$dns_engine" -d "$TARGET" -r "$OUTPUT_DIR/resolvers.txt" \
+                -p "$OUTPUT_DIR/02_subdomain_enum/passive_combined.txt" \
+                -a /usr/share/seclists/Discovery/DNS/alterations.txt \
+                -o "$OUTPUT_DIR/02_subdomain_enum/permutation/dns_permutations.txt" \
+                --cnames "$OUTPUT_DIR/02_subdomain_enum/permutation/dns_permutation_cnames.txt"
+        fi
+
+        # Merge newly resolved hosts into the subdomain list and probe them
+        local subdomains="$OUTPUT_DIR/02_subdomain_enum/passive_combined.txt"
+        local new_hosts="$OUTPUT_DIR/02_subdomain_enum/active/dns_new_hosts.txt"
+        touch "$subdomains"
+        cat "$OUTPUT_DIR/02_subdomain_enum/active/dns_bruteforce.txt" "$OUTPUT_DIR/02_subdomain_enum/permutation/dns_permutations.txt" 2>/dev/null | sort -u | comm -13 <(sort -u "$subdomains") - > "$new_hosts"
+        if [ -s "$new_hosts" ]; then
+            sort -u "$subdomains" "$new_hosts" -o "$subdomains"
+            httpx -l "$new_hosts" -silent -timeout 10 >> "$OUTPUT_DIR/03_host_discovery/alive/live_hosts.txt" 2>/dev/null
+            SUBDOMAIN_COUNT=$(wc -l < "$subdomains")
+            LIVE_HOST_COUNT=$(wc -l < "$OUTPUT_DIR/03_host_discovery/alive/live_hosts.txt")
+            log "DNS resolution added $(wc -l < "$new_hosts") new subdomains ($SUBDOMAIN_COUNT total, $LIVE_HOST_COUNT live)"
+        fi
+    else
+        # Active DNS brute forcing with common wordlist
+        if command -v ffuf &> /dev/null; then
+            # Use ffuf for DNS fuzzing if available
+            ffuf -w /usr/share/seclists/Discovery/DNS/subdomains-top1million-110000.txt:FUZZ -u "http://FUZZ.$TARGET" -mc 200,204,301,302,307,401,403,405,500 -o "$OUTPUT_DIR/02_subdomain_enum/active/ffuf_dns.json" -of json -t 50 2>/dev/null
+        fi
 
-    # Altdns for permutation-based discovery
-    if [ -f "$OUTPUT_DIR/02_subdomain_enum/passive_combined.txt" ]; then
-        altdns -i "$OUTPUT_DIR/02_subdomain_enum/passive_combined.txt" -o "$OUTPUT_DIR/02_subdomain_enum/permutation/altdns.txt" -w /usr/share/seclists/Discovery/DNS/alterations.txt 2>/dev/null
+        # Altdns for permutation-based discovery
+        if [ -f "$OUTPUT_DIR/02_subdomain_enum/passive_combined.txt" ]; then
+            altdns -i "$OUTPUT_DIR/02_subdomain_enum/passive_combined.txt" -o "$OUTPUT_DIR/02_subdomain_enum/permutation/altdns.txt" -w /usr/share/seclists/Discovery/DNS/alterations.txt 2>/dev/null
+        fi
     fi
 
     log "Comprehensive subdomain enumeration completed"
@@ -307,11 +359,20 @@ module_crawling_and_analysis() {
     # Gospider for additional crawling
     gospider -S "$OUTPUT_DIR/03_host_discovery/alive/live_hosts.txt" -d 2 -c 10 --other-source -o "$OUTPUT_DIR/05_crawling/endpoints/gospider_output" 2>/dev/null
 
-    # Extract JavaScript files
-    grep -i "\.js" "$OUTPUT_DIR/05_crawling/endpoints/katana_endpoints.txt" > "$OUTPUT_DIR/05_crawling/js_files/javascript_files.txt" 2>/dev/null
+    local url_processor
+    if url_processor=$(find_python_module url_processor.py); then
+        # Cluster crawled and archived URLs into one representative per path template
+        cat "$OUTPUT_DIR/05_crawling/endpoints/katana_endpoints.txt" "$OUTPUT_DIR/07_intelligence/wayback/combined_urls.txt" 2>/dev/null | python3 "$url_processor" \
+            -o "$OUTPUT_DIR/05_crawling/endpoints/unique_endpoints.txt" \
+            -p "$OUTPUT_DIR/05_crawling/parameters/parameters.txt" \
+            --param-counts "$OUTPUT_DIR/05_crawling/parameters/parameter_frequency.txt"
+    else
+        # Extract parameters from URLs
+        cat "$OUTPUT_DIR/05_crawling/endpoints/katana_endpoints.txt" | grep "?" | sed 's/.*?//g' | tr '&' '\n' | cut -d'=' -f1 | sort -u > "$OUTPUT_DIR/05_crawling/parameters/parameters.txt" 2>/dev/null
+    fi
 
-    # Extract parameters from URLs
-    cat "$OUTPUT_DIR/05_crawling/endpoints/katana_endpoints.txt" | grep "?" | sed 's/.*?//g' | tr '&' '\n' | cut -d'=' -f1 | sort -u > "$OUTPUT_DIR/05_crawling/parameters/parameters.txt" 2>/dev/null
+    # Extract JavaScript files from the full crawl output, not the clustered list
+    grep -i "\.js" "$OUTPUT_DIR/05_crawling/endpoints/katana_endpoints.txt" > "$OUTPUT_DIR/05_crawling/js_files/javascript_files.txt" 2>/dev/null
 
     log "Web crawling completed"
 }
@@ -323,6 +384,12 @@ module_vuln_scanning() {
     # Nuclei scanning
     nuclei -l "$OUTPUT_DIR/03_host_discovery/alive/live_hosts.txt" -t ~/nuclei-templates/ -o "$OUTPUT_DIR/06_vulnerability_scan/nuclei/nuclei_results.txt" 2>/dev/null
 
+    # Nuclei DAST fuzzing on one representative URL per parameterized endpoint
+    grep "?" "$OUTPUT_DIR/05_crawling/endpoints/unique_endpoints.txt" > "$OUTPUT_DIR/05_crawling/endpoints/fuzzable_endpoints.txt" 2>/dev/null
+    if [ -s "$OUTPUT_DIR/05_crawling/endpoints/fuzzable_endpoints.txt" ]; then
+        nuclei -l "$OUTPUT_DIR/05_crawling/endpoints/fuzzable_endpoints.txt" -dast -t ~/nuclei-templates/ -o "$OUTPUT_DIR/06_vulnerability_scan/nuclei/nuclei_dast_results.txt" 2>/dev/null
+    fi
+
     # Secret finder on JS files
     if [ -s "$OUTPUT_DIR/05_crawling/js_files/javascript_files.txt" ]; then
         while read -r js_url; do
@@ -409,6 +476,19 @@ generate_report() {
     local end_time=$(date +%s)
     local duration=$((end_time - START_TIME))
 
+    # Prefer the Python report engine (single pass, cached line counts, md/html/json)
+    local report_engine
+    if report_engine=$(find_python_module recon_report.py); then
+        if python3 "$report_engine" -r "$OUTPUT_DIR" -f md,html,json \
+            --target "$TARGET" --scope "$SCOPE_SIZE" --duration "$duration" \
+            --subdomains "$SUBDOMAIN_COUNT" --live-hosts "$LIVE_HOST_COUNT" \
+            -o "$OUTPUT_DIR/final_report/reconnaissance_report"; then
+            log "Report generated: $report_file"
+            return
+        fi
+        warning "Report engine failed, falling back to the basic markdown report"
+    fi
+
     cat > "$report_file" << EOF
 # Reconnaissance Report for $TARGET
 
@@ -431,6 +511,7 @@ generate_report() {
 
 ### Security Findings
 - Nuclei vulnerabilities: $([ -f "$OUTPUT_DIR/06_vulnerability_scan/nuclei/nuclei_results.txt" ] && wc -l < "$OUTPUT_DIR/06_vulnerability_scan/nuclei/nuclei_results.txt" || echo "0")
+- Nuclei DAST findings: $([ -f "$OUTPUT_DIR/06_vulnerability_scan/nuclei/nuclei_dast_results.txt" ] && wc -l < "$OUTPUT_DIR/06_vulnerability_scan/nuclei/nuclei_dast_results.txt" || echo "0")
 - Potential subdomain takeovers: $([ -f "$OUTPUT_DIR/06_vulnerability_scan/nuclei/subjack_results.txt" ] && wc -l < "$OUTPUT_DIR/06_vulnerability_scan/nuclei/subjack_results.txt" || echo "0")
 - JavaScript secrets: $([ -f "$OUTPUT_DIR/06_vulnerability_scan/secrets/js_secrets.txt" ] && wc -l < "$OUTPUT_DIR/06_vulnerability_scan/secrets/js_secrets.txt" || echo "0")
 
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Bug Hunter URL Processor
+Streams wayback/gau/crawler output, normalizes URLs, clusters them by path
+template and parameter set, and keeps one representative per cluster.
+"""
+import re
+import sys
+import argparse
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Tuple, Iterable, Iterator, TextIO
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote_plus
+
+from dedup import Deduper
+
+###############################################################################
+# Configuration
+###############################################################################
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+STATIC_EXTENSIONS = frozenset((
+    "png", "jpg", "jpeg", "gif", "bmp", "ico", "svg", "webp", "tif", "tiff",
+    "css", "woff", "woff2", "ttf", "eot", "otf",
+    "mp3", "mp4", "avi", "mov", "webm", "flv", "wav",
+))
+# Content-hashed bundles differ only by hash, so these keep their exact path
+SCRIPT_EXTENSIONS = frozenset(("js", "mjs", "map"))
+TRACKING_PARAMS = frozenset(("fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "_ga"))
+
+SEGMENT_PATTERNS = (
+    ("{uuid}", re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I)),
+    ("{int}", re.compile(r"^\d+$")),
+    ("{date}", re.compile(r"^\d{4}[-_/]?\d{2}[-_/]?\d{2}$")),
+    ("{hex}", re.compile(r"^[0-9a-f]{16,}$", re.I)),
+    ("{token}", re.compile(r"^(?=[^/]*\d)(?=[^/]*[a-z])[a-z0-9_\-]{20,}$", re.I)),
+)
+TRAILING_NUMBER = re.compile(r"^(.*?[-_.])\d+$")
+HAS_DIGIT = re.compile(r"\d")
+
+PARAM_INDEX_MAX = 200_000
+
+###############################################################################
+# Normalization
+###############################################################################
+
+def _normalize_path(path: str) -> str:
+    segments: List[str] = []
+    for segment in path.split("/"):
+        if segment in ("", "."):
+            continue
+        if segment == "..":
+            if segments:
+                segments.pop()
+            continue
+        segments.append(segment)
+    normalized = "/" + "/".join(segments)
+    if path.endswith("/") and segments:
+        normalized += "/"
+    return normalized
+
+def _split_url(url: str) -> Optional[Tuple[str, str, str, str]]:
+    """Split a URL into (scheme, netloc, normalized path, raw query) or None if invalid."""
+    url = url.strip()
+    if not url[:8].lower().startswith(("http://", "https://")):
+        return None
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if not host:
+        return None
+    if ":" in host:
+        host = f"[{host}]"
+    netloc = host if port in (None, DEFAULT_PORTS.get(scheme)) else f"{host}:{port}"
+    return scheme, netloc, _normalize_path(parts.path), parts.query
+
+def _is_tracking(name: str) -> bool:
+    return name in TRACKING_PARAMS or name.startswith("utm_")
+
+def param_names(query: str, drop_tracking: bool = True) -> List[str]:
+    """Sorted, unique parameter names of a raw query string."""
+    names = set()
+    for pair in query.split("&"):
+        name = pair.partition("=")[0]
+        if "%" in name or "+" in name:
+            name = unquote_plus(name)
+        if name and not (drop_tracking and _is_tracking(name)):
+            names.add(name)
+    return sorted(names)
+
+def normalize_url(url: str, drop_tracking: bool = True) -> Optional[Tuple[str, str, str, List[Tuple[str, str]]]]:
+    """Normalize a URL; return (scheme, netloc, path, sorted params) or None if invalid."""
+    split = _split_url(url)
+    if split is None:
+        return None
+    scheme, netloc, path, query = split
+    params = [
+        (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+        if not (drop_tracking and _is_tracking(key))
+    ]
+    params.sort()
+    return scheme, netloc, path, params
+
+def format_url(scheme: str, netloc: str, path: str, params: List[Tuple[str, str]]) -> str:
+    """Rebuild a normalized URL string."""
+    return urlunsplit((scheme, netloc, path, urlencode(params), ""))
+
+def template_segment(segment: str) -> str:
+    """Replace variable-looking path segments with a placeholder."""
+    if segment.isdigit():
+        return "{int}"
+    if not HAS_DIGIT.search(segment) and len(segment) < 16:
+        return segment
+    stem, dot, ext = segment.rpartition(".")
+    if not dot or not stem or not ext.isalnum() or len(ext) > 5:
+        stem, ext = segment, ""
+    for placeholder, pattern in SEGMENT_PATTERNS:
+        if pattern.match(stem):
+            stem = placeholder
+            break
+    else:
+        match = TRAILING_NUMBER.match(stem)
+        if match:
+            stem = match.group(1) + "{int}"
+    return f"{stem}.{ext}" if ext else stem
+
+def path_template(path: str) -> str:
+    """Return the template of a normalized path, e.g. /item/{int}/edit."""
+    return "/".join(template_segment(s) if s else s for s in path.split("/"))
+
+def _extension(path: str) -> str:
+    last = path.rsplit("/", 1)[-1]
+    return last.rsplit(".", 1)[1].lower() if "." in last else ""
+
+def is_static(path: str) -> bool:
+    """True for paths pointing at images, fonts, stylesheets and media."""
+    return _extension(path) in STATIC_EXTENSIONS
+
+def is_script(path: str) -> bool:
+    """True for JavaScript bundles and source maps."""
+    return _extension(path) in SCRIPT_EXTENSIONS
+
+###############################################################################
+# Clustering
+###############################################################################
+
+class URLClusterer:
+    """Streaming URL deduplicator.
+
+    URLs that share host, path template and parameter names fall in the same
+    cluster; the first one seen is emitted as its representative. Script
+    assets (.js/.mjs/.map) are never templated, so every distinct bundle is
+    kept. Memory is bounded by the Deduper (exact set, then Bloom filter)
+    and by pruning the parameter index once it grows past
+    ``param_index_max`` names.
+    """
+
+    def __init__(self, keep_static: bool = False, drop_tracking: bool = True,
+                 deduper: Optional[Deduper] = None, param_index_max: int = PARAM_INDEX_MAX):
+        self.keep_static = keep_static
+        self.drop_tracking = drop_tracking
+        self.deduper = deduper or Deduper()
+        self.param_index_max = param_index_max
+        self.param_counts: Counter = Counter()
+        self.stats = {"input": 0, "invalid": 0, "static": 0, "duplicates": 0, "clusters": 0}
+
+    def _count_params(self, names: Iterable[str]) -> None:
+        self.param_counts.update(names)
+        if len(self.param_counts) > self.param_index_max:
+            self.param_counts = Counter({k: v for k, v in self.param_counts.items() if v > 1})
+
+    def add(self, url: str) -> Optional[str]:
+        """Process one URL; return its normalized form if it opens a new cluster."""
+        self.stats["input"] += 1
+        split = _split_url(url)
+        if split is None:
+            self.stats["invalid"] += 1
+            return None
+        scheme, netloc, path, query = split
+        if not self.keep_static and is_static(path):
+            self.stats["static"] += 1
+            return None
+        names = param_names(query, self.drop_tracking) if query else []
+        self._count_params(names)
+        template = path if is_script(path) else path_template(path)
+        key = f"{netloc}{template}?{'&'.join(names)}"
+        if self.deduper.seen(key):
+            self.stats["duplicates"] += 1
+            return None
+        self.stats["clusters"] += 1
+        _, _, _, params = normalize_url(url, self.drop_tracking)
+        return format_url(scheme, netloc, path, params)
+
+    def process(self, urls: Iterable[str]) -> Iterator[str]:
+        """Yield one representative URL per cluster."""
+        for url in urls:
+            representative = self.add(url)
+            if representative is not None:
+                yield representative
+
+    def parameters(self) -> List[Tuple[str, int]]:
+        """Parameter names with their frequencies, most common first."""
+        return sorted(self.param_counts.items(), key=lambda item: (-item[1], item[0]))
+
+###############################################################################
+# Main
+###############################################################################
+
+def iter_lines(paths: List[Path]) -> Iterator[str]:
+    """Stream lines from files, or stdin when no paths are given."""
+    if not paths:
+        yield from sys.stdin
+        return
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+            yield from fh
+
+def _open_output(path: Optional[Path]) -> TextIO:
+    return open(path, "w", encoding="utf-8") if path else sys.stdout
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Normalize and cluster URLs, keeping one per path template")
+    parser.add_argument("inputs", nargs="*", type=Path, help="URL files (default: stdin)")
+    parser.add_argument("-o", "--output", type=Path, help="Representative URLs (default: stdout)")
+    parser.add_argument("-p", "--params", type=Path, help="Parameter names, most frequent first")
+    parser.add_argument("--param-counts", type=Path, help="Parameter frequency index (count<TAB>name)")
+    parser.add_argument("--keep-static", action="store_true", help="Keep images, fonts, css and media")
+    parser.add_argument("--keep-tracking", action="store_true", help="Keep utm_*/fbclid/gclid parameters")
+    args = parser.parse_args(argv)
+
+    clusterer = URLClusterer(keep_static=args.keep_static, drop_tracking=not args.keep_tracking)
+    out = _open_output(args.output)
+    try:
+        for url in clusterer.process(iter_lines(args.inputs)):
+            out.write(url + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    params = clusterer.parameters()
+    if args.params:
+        with _open_output(args.params) as fh:
+            fh.writelines(f"{name}\n" for name, _ in params)
+    if args.param_counts:
+        with _open_output(args.param_counts) as fh:
+            fh.writelines(f"{count}\t{name}\n" for name, count in params)
+
+    stats = clusterer.stats
+    print(f"[url_processor] {stats['input']} urls -> {stats['clusters']} clusters "
+          f"({stats['duplicates']} duplicates, {stats['static']} static, {stats['invalid']} invalid), "
+          f"{len(params)} parameters", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())